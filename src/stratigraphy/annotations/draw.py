@@ -1,5 +1,6 @@
 """This module contains functionalities to draw on pdf pages."""
 
+import functools
 import logging
 import os
 from pathlib import Path
@@ -18,12 +19,27 @@ from stratigraphy.util.predictions import FilePredictions
 load_dotenv()
 
 mlflow_tracking = os.getenv("MLFLOW_TRACKING") == "True"  # Checks whether MLFlow tracking is enabled
+if mlflow_tracking:
+    import mlflow
 
 colors = ["purple", "blue"]
 
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def get_color(name: str) -> tuple[float, float, float]:
+    """Get the RGB values of a color, as fitz.utils.getColor, but only looking up every color name once.
+
+    Args:
+        name (str): The name of the color.
+
+    Returns:
+        tuple[float, float, float]: The RGB values of the color.
+    """
+    return fitz.utils.getColor(name)
+
+
 def draw_predictions(
     predictions: dict[str, FilePredictions],
     directory: Path,
@@ -65,11 +81,12 @@ def draw_predictions(
         with fitz.Document(directory / file_name) as doc:
             for page_index, page in enumerate(doc):
                 page_number = page_index + 1
+                derotation_matrix = page.derotation_matrix
                 shape = page.new_shape()  # Create a shape object for drawing
                 if page_number == 1:
                     draw_metadata(
                         shape,
-                        page.derotation_matrix,
+                        derotation_matrix,
                         page.rotation,
                         coordinates,
                         is_coordinates_correct,
@@ -85,12 +102,12 @@ def draw_predictions(
                         draw_groundwater(shape, groundwater_entry)
                 draw_depth_columns_and_material_rect(
                     shape,
-                    page.derotation_matrix,
+                    derotation_matrix,
                     [pair for pair in depths_materials_column_pairs if pair["page"] == page_number],
                 )
                 draw_material_descriptions(
                     shape,
-                    page.derotation_matrix,
+                    derotation_matrix,
                     [
                         layer
                         for layer in file_prediction.layers
@@ -99,16 +116,13 @@ def draw_predictions(
                 )
                 shape.commit()  # Commit all the drawing operations to the page
 
+                # The rendered page is the output of the drawing (written to out_directory), so it is needed
+                # regardless of whether MLFlow tracking is enabled; only the upload is conditional.
                 tmp_file_path = out_directory / f"{file_name}_page{page_number}.png"
                 fitz.utils.get_pixmap(page, matrix=fitz.Matrix(2, 2), clip=page.rect).save(tmp_file_path)
 
                 if mlflow_tracking:  # This is only executed if MLFlow tracking is enabled
-                    try:
-                        import mlflow
-
-                        mlflow.log_artifact(tmp_file_path, artifact_path="pages")
-                    except NameError:
-                        logger.warning("MLFlow could not be imported. Skipping logging of artifact.")
+                    mlflow.log_artifact(tmp_file_path, artifact_path="pages")
 
         logger.info("Finished drawing predictions for file %s", file_name)
 
@@ -144,14 +158,14 @@ def draw_metadata(
     elevation_rect = fitz.Rect([5, 25, 200, 45])
 
     shape.draw_rect(coordinate_rect * derotation_matrix)
-    shape.finish(fill=fitz.utils.getColor("gray"), fill_opacity=0.5)
+    shape.finish(fill=get_color("gray"), fill_opacity=0.5)
     shape.insert_textbox(coordinate_rect * derotation_matrix, f"Coordinates: {coordinates}", rotate=rotation)
     shape.draw_line(
         coordinate_rect.top_left * derotation_matrix,
         coordinate_rect.bottom_left * derotation_matrix,
     )
     shape.finish(
-        color=fitz.utils.getColor(coordinate_color),
+        color=get_color(coordinate_color),
         width=6,
         stroke_opacity=0.5,
     )
@@ -159,14 +173,14 @@ def draw_metadata(
     # Draw the bounding box around the elevation information
     elevation_txt = f"Elevation: {elevation_info.elevation} m" if elevation_info is not None else "Elevation: N/A"
     shape.draw_rect(elevation_rect * derotation_matrix)
-    shape.finish(fill=fitz.utils.getColor("gray"), fill_opacity=0.5)
+    shape.finish(fill=get_color("gray"), fill_opacity=0.5)
     shape.insert_textbox(elevation_rect * derotation_matrix, elevation_txt, rotate=rotation)
     shape.draw_line(
         elevation_rect.top_left * derotation_matrix,
         elevation_rect.bottom_left * derotation_matrix,
     )
     shape.finish(
-        color=fitz.utils.getColor(elevation_color),
+        color=get_color(elevation_color),
         width=6,
         stroke_opacity=0.5,
     )
@@ -180,7 +194,7 @@ def draw_coordinates(shape: fitz.Shape, coordinates: Coordinate) -> None:
         coordinates (Coordinate): The coordinate object to draw.
     """
     shape.draw_rect(coordinates.rect)
-    shape.finish(color=fitz.utils.getColor("purple"))
+    shape.finish(color=get_color("purple"))
 
 
 def draw_groundwater(shape: fitz.Shape, groundwater_entry: GroundwaterInformationOnPage) -> None:
@@ -191,7 +205,7 @@ def draw_groundwater(shape: fitz.Shape, groundwater_entry: GroundwaterInformatio
         groundwater_entry (GroundwaterInformationOnPage): The groundwater information to draw.
     """
     shape.draw_rect(groundwater_entry.rect)
-    shape.finish(color=fitz.utils.getColor("pink"))
+    shape.finish(color=get_color("pink"))
 
 
 def draw_elevation(shape: fitz.Shape, elevation: Elevation) -> None:
@@ -202,7 +216,7 @@ def draw_elevation(shape: fitz.Shape, elevation: Elevation) -> None:
         elevation (Elevation): The elevation information to draw.
     """
     shape.draw_rect(elevation.rect)
-    shape.finish(color=fitz.utils.getColor("blue"))
+    shape.finish(color=get_color("blue"))
 
 
 def draw_material_descriptions(
@@ -225,7 +239,7 @@ def draw_material_descriptions(
             shape.draw_rect(
                 fitz.Rect(layer.material_description.rect) * derotation_matrix,
             )
-            shape.finish(color=fitz.utils.getColor("orange"))
+            shape.finish(color=get_color("orange"))
         draw_layer(
             shape=shape,
             derotation_matrix=derotation_matrix,
@@ -260,17 +274,17 @@ def draw_depth_columns_and_material_rect(
             shape.draw_rect(
                 fitz.Rect(depth_column["rect"]) * derotation_matrix,
             )
-            shape.finish(color=fitz.utils.getColor("green"))
+            shape.finish(color=get_color("green"))
             for depth_column_entry in depth_column["entries"]:  # Draw rectangle for depth column entries
                 shape.draw_rect(
                     fitz.Rect(depth_column_entry["rect"]) * derotation_matrix,
                 )
-            shape.finish(color=fitz.utils.getColor("purple"))
+            shape.finish(color=get_color("purple"))
 
         shape.draw_rect(  # Draw rectangle for material description column
             fitz.Rect(material_description_rect) * derotation_matrix,
         )
-        shape.finish(color=fitz.utils.getColor("red"))
+        shape.finish(color=get_color("red"))
 
 
 def draw_layer(
@@ -305,9 +319,9 @@ def draw_layer(
         for line in [line for line in layer.lines]:
             shape.draw_rect(line.rect * derotation_matrix)
             shape.finish(
-                color=fitz.utils.getColor(color),
+                color=get_color(color),
                 fill_opacity=0.2,
-                fill=fitz.utils.getColor(color),
+                fill=get_color(color),
                 width=0,
             )
             if is_correct is not None:
@@ -317,7 +331,7 @@ def draw_layer(
                     line.rect.bottom_left * derotation_matrix,
                 )
                 shape.finish(
-                    color=fitz.utils.getColor(correct_color),
+                    color=get_color(correct_color),
                     width=6,
                     stroke_opacity=0.5,
                 )
@@ -330,9 +344,9 @@ def draw_layer(
                     background_rect * derotation_matrix,
                 )
                 shape.finish(
-                    color=fitz.utils.getColor(color),
+                    color=get_color(color),
                     fill_opacity=0.2,
-                    fill=fitz.utils.getColor(color),
+                    fill=get_color(color),
                     width=0,
                 )
 
@@ -344,7 +358,7 @@ def draw_layer(
                         background_rect.bottom_left * derotation_matrix,
                     )
                     shape.finish(
-                        color=fitz.utils.getColor(depth_is_correct_color),
+                        color=get_color(depth_is_correct_color),
                         width=6,
                         stroke_opacity=0.5,
                     )
@@ -357,5 +371,5 @@ def draw_layer(
                     fitz.Point(layer_rect.x0, (layer_rect.y0 + layer_rect.y1) / 2) * derotation_matrix,
                 )
                 shape.finish(
-                    color=fitz.utils.getColor(color),
+                    color=get_color(color),
                 )
@@ -104,11 +104,13 @@ def draw_blocks_and_lines(page: fitz.Page, blocks: list[TextBlock], lines: list[
     """
     scale_factor = 2
 
+    derotation_matrix = page.derotation_matrix
+    color = fitz.utils.getColor("orange")
     for block in blocks:  # draw all blocks in the page
         fitz.utils.draw_rect(
             page,
-            block.rect() * page.derotation_matrix,
-            color=fitz.utils.getColor("orange"),
+            block.rect() * derotation_matrix,
+            color=color,
         )
 
     open_cv_img = convert_page_to_opencv_img(page, scale_factor=2)
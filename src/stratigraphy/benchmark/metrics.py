@@ -42,15 +42,16 @@ class DatasetMetrics:
 
         TODO: we probably should not use this metric, and use the proper macro F1 score instead.
         """
-        if self.metrics and self.macro_precision() + self.macro_recall() > 0:
-            return 2 * self.macro_precision() * self.macro_recall() / (self.macro_precision() + self.macro_recall())
+        precision = self.macro_precision()
+        recall = self.macro_recall()
+        if precision + recall > 0:
+            return 2 * precision * recall / (precision + recall)
         else:
             return 0
 
-    def to_dataframe(self, name: str, fn: Callable[[Metrics], float]) -> pd.DataFrame:
-        """Convert the metrics to a DataFrame."""
-        series = pd.Series({filename: fn(metric) for filename, metric in self.metrics.items()})
-        return series.to_frame(name=name)
+    def to_series(self, fn: Callable[[Metrics], float]) -> pd.Series:
+        """Convert the metrics to a Series that is indexed by the document names."""
+        return pd.Series({filename: fn(metric) for filename, metric in self.metrics.items()})
 
 
 class DatasetMetricsCatalog:
@@ -61,20 +62,18 @@ class DatasetMetricsCatalog:
 
     def document_level_metrics_df(self) -> pd.DataFrame:
         """Return a DataFrame with all the document level metrics."""
-        all_series = [
-            self.metrics["layer"].to_dataframe("F1", lambda metric: metric.f1),
-            self.metrics["layer"].to_dataframe("precision", lambda metric: metric.precision),
-            self.metrics["layer"].to_dataframe("recall", lambda metric: metric.recall),
-            self.metrics["depth_interval"].to_dataframe("Depth_interval_accuracy", lambda metric: metric.precision),
-            self.metrics["layer"].to_dataframe("Number Elements", lambda metric: metric.tp + metric.fn),
-            self.metrics["layer"].to_dataframe("Number wrong elements", lambda metric: metric.fp + metric.fn),
-            self.metrics["groundwater"].to_dataframe("groundwater", lambda metric: metric.f1),
-            self.metrics["groundwater_depth"].to_dataframe("groundwater_depth", lambda metric: metric.f1),
-        ]
-        document_level_metrics = pd.DataFrame()
-        for series in all_series:
-            document_level_metrics = document_level_metrics.join(series, how="outer")
-        return document_level_metrics
+        all_series = {
+            "F1": self.metrics["layer"].to_series(lambda metric: metric.f1),
+            "precision": self.metrics["layer"].to_series(lambda metric: metric.precision),
+            "recall": self.metrics["layer"].to_series(lambda metric: metric.recall),
+            "Depth_interval_accuracy": self.metrics["depth_interval"].to_series(lambda metric: metric.precision),
+            "Number Elements": self.metrics["layer"].to_series(lambda metric: metric.tp + metric.fn),
+            "Number wrong elements": self.metrics["layer"].to_series(lambda metric: metric.fp + metric.fn),
+            "groundwater": self.metrics["groundwater"].to_series(lambda metric: metric.f1),
+            "groundwater_depth": self.metrics["groundwater_depth"].to_series(lambda metric: metric.f1),
+        }
+        # a single DataFrame construction aligns all the indices in one pass (outer join)
+        return pd.DataFrame(all_series).sort_index()
 
     def metrics_dict(self) -> dict[str, float]:
         """Return a dictionary with the overall metrics."""
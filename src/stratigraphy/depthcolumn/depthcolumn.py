@@ -31,10 +31,11 @@ class DepthColumn(metaclass=abc.ABCMeta):
     """Used for scoring how well a depth column corresponds to a material description bbox."""
 
     def rect(self) -> fitz.Rect:
-        x0 = min([rect.x0 for rect in self.rects()])
-        x1 = max([rect.x1 for rect in self.rects()])
-        y0 = min([rect.y0 for rect in self.rects()])
-        y1 = max([rect.y1 for rect in self.rects()])
+        rects = self.rects()
+        x0 = min([rect.x0 for rect in rects])
+        x1 = max([rect.x1 for rect in rects])
+        y0 = min([rect.y0 for rect in rects])
+        y1 = max([rect.y1 for rect in rects])
         return fitz.Rect(x0, y0, x1, y1)
 
     @property
@@ -291,10 +292,12 @@ class BoundaryDepthColumn(DepthColumn):
         Returns:
             int: The number of words that intersect with the depth column entries but are not part of it.
         """
+        rect = self.rect()  # the union of all entry rects, so only compute it once
+        min_intersection_width = 0.25 * rect.width
 
         def significant_intersection(other_rect):
-            intersection = fitz.Rect(other_rect).intersect(self.rect())
-            return intersection.is_valid and intersection.width > 0.25 * self.rect().width
+            intersection = fitz.Rect(other_rect).intersect(rect)
+            return intersection.is_valid and intersection.width > min_intersection_width
 
         return len([word for word in all_words if significant_intersection(word.rect)]) - len(self.entries)
 
@@ -8,6 +8,9 @@ import fitz
 class DepthColumnEntry:  # noqa: D101
     """Class to represent a depth column entry."""
 
+    # many entries are created for each page, so we avoid having a __dict__ per instance
+    __slots__ = ("rect", "value", "page_number")
+
     def __init__(self, rect: fitz.Rect, value: float, page_number: int):
         self.rect = rect
         self.value = value
@@ -32,6 +35,8 @@ class AnnotatedDepthColumnEntry(DepthColumnEntry):  # noqa: D101
     Therefore, we set them to None.
     """
 
+    __slots__ = ()
+
     def __init__(self, value):
         super().__init__(None, value, None)
 
@@ -46,9 +51,12 @@ class AnnotatedDepthColumnEntry(DepthColumnEntry):  # noqa: D101
 class LayerDepthColumnEntry:  # noqa: D101
     """Class to represent a layer depth column entry."""
 
+    __slots__ = ("start", "end", "_rect")
+
     def __init__(self, start: DepthColumnEntry, end: DepthColumnEntry):
         self.start = start
         self.end = end
+        self._rect = None
 
         assert start.page_number == end.page_number, "Start and end entries are on different pages."
 
@@ -57,14 +65,33 @@ class LayerDepthColumnEntry:  # noqa: D101
 
     @property
     def rect(self) -> fitz.Rect:
-        """Get the rectangle of the layer depth column entry."""
-        return fitz.Rect(self.start.rect).include_rect(self.end.rect)
+        """Get the rectangle of the layer depth column entry.
+
+        The rectangle is computed only once, as the start and end entries do not change.
+        """
+        if self._rect is None:
+            self._rect = self._compute_rect()
+        return self._rect
+
+    def _compute_rect(self) -> fitz.Rect:
+        start_rect = self.start.rect
+        end_rect = self.end.rect
+        if start_rect.is_empty or start_rect.is_infinite or end_rect.is_empty or end_rect.is_infinite:
+            # degenerate rectangles are handled specially by PyMuPDF
+            return fitz.Rect(start_rect).include_rect(end_rect)
+        return fitz.Rect(
+            min(start_rect.x0, end_rect.x0),
+            min(start_rect.y0, end_rect.y0),
+            max(start_rect.x1, end_rect.x1),
+            max(start_rect.y1, end_rect.y1),
+        )
 
     def to_json(self) -> dict[str, Any]:
         """Convert the layer depth column entry to a JSON serializable format."""
+        rect = self.rect
         return {
             "start": self.start.to_json(),
             "end": self.end.to_json(),
-            "rect": [self.rect.x0, self.rect.y0, self.rect.x1, self.rect.y1],
+            "rect": [rect.x0, rect.y0, rect.x1, rect.y1],
             "page": self.start.page_number,
         }
@@ -22,22 +22,47 @@ def depth_column_entries(all_words: list[TextWord], include_splits: bool) -> lis
     Returns:
         list[DepthColumnEntry]: The extracted depth column entries.
     """
+    return [
+        entry
+        for entry, is_split in depth_column_entries_with_split_flag(all_words, include_splits)
+        if include_splits or not is_split
+    ]
+
+
+def depth_column_entries_with_split_flag(
+    all_words: list[TextWord], include_splits: bool = True
+) -> list[tuple[DepthColumnEntry, bool]]:
+    """Find all depth column entries, together with a flag whether the entry was obtained by splitting a word.
+
+    Split entries stem from words such as "1.10-1.60m", that contain both the start and the end of a layer. Filtering
+    out the split entries from the result gives the same entries as depth_column_entries(all_words, False), which
+    allows the caller to compute both variants from a single pass over the words.
+
+    Args:
+        all_words (list[TextWord]): List of text words to extract depth column entries from.
+        include_splits (bool, optional): Whether to look for split entries at all. Defaults to True.
+
+    Returns:
+        list[tuple[DepthColumnEntry, bool]]: The extracted depth column entries and whether they are split entries.
+    """
+    regex = re.compile(r"^-?\.?([0-9]+(\.[0-9]+)?)[müMN\\.]*$")
     entries = []
     for word in sorted(all_words, key=lambda word: word.rect.y0):
         try:
             input_string = word.text.strip().replace(",", ".")
-            regex = re.compile(r"^-?\.?([0-9]+(\.[0-9]+)?)[müMN\\.]*$")
             # numbers such as '.40' are not supported. The reason is that sometimes the OCR
             # recognizes a '-' as a '.' and we just ommit the leading '.' to avoid this issue.
             match = regex.match(input_string)
             if match:
                 value = value_as_float(match.group(1))
-                entries.append(DepthColumnEntry(word.rect, value, word.page_number))
+                entries.append((DepthColumnEntry(word.rect, value, word.page_number), False))
             elif include_splits:
                 # support for e.g. "1.10-1.60m" extracted as a single word
                 layer_depth_column_entry = extract_layer_depth_interval(input_string, word.rect, word.page_number)
                 entries.extend(
-                    [layer_depth_column_entry.start, layer_depth_column_entry.end] if layer_depth_column_entry else []
+                    [(layer_depth_column_entry.start, True), (layer_depth_column_entry.end, True)]
+                    if layer_depth_column_entry
+                    else []
                 )
         except ValueError:
             pass
@@ -2,8 +2,10 @@
 
 import logging
 import math
+from collections import Counter
 
 import fitz
+import numpy as np
 
 from stratigraphy.depthcolumn import find_depth_columns
 from stratigraphy.depthcolumn.depthcolumn import DepthColumn
@@ -21,11 +23,7 @@ from stratigraphy.text.find_description import (
 from stratigraphy.text.textblock import TextBlock, block_distance
 from stratigraphy.util.dataclasses import Line
 from stratigraphy.util.interval import BoundaryInterval, Interval
-from stratigraphy.util.util import (
-    remove_empty_predictions,
-    x_overlap,
-    x_overlap_significant_smallest,
-)
+from stratigraphy.util.util import batch_x_overlap_significant, rects_to_soa, remove_empty_predictions
 
 logger = logging.getLogger(__name__)
 
@@ -70,18 +68,20 @@ def process_page(
     # If there is a layer identifier column, then we use this directly.
     # Else, we search for depth columns. We could also think of some scoring mechanism to decide which one to use.
     if not pairs:
-        depth_column_entries = find_depth_columns.depth_column_entries(words, include_splits=True)
+        entries_with_split_flag = find_depth_columns.depth_column_entries_with_split_flag(words)
+        depth_column_entries = [entry for entry, _ in entries_with_split_flag]
         layer_depth_columns = find_depth_columns.find_layer_depth_columns(depth_column_entries, words)
 
-        used_entry_rects = []
+        # fitz.Rect objects are not hashable, so we keep track of their coordinates instead
+        used_entry_rects = set()
         for column in layer_depth_columns:
             for entry in column.entries:
-                used_entry_rects.extend([entry.start.rect, entry.end.rect])
+                used_entry_rects.update([tuple(entry.start.rect), tuple(entry.end.rect)])
 
         depth_column_entries = [
             entry
-            for entry in find_depth_columns.depth_column_entries(words, include_splits=False)
-            if entry.rect not in used_entry_rects
+            for entry, is_split in entries_with_split_flag
+            if not is_split and tuple(entry.rect) not in used_entry_rects
         ]
         depth_columns: list[DepthColumn] = layer_depth_columns
         depth_columns.extend(
@@ -99,10 +99,7 @@ def process_page(
         # lowest score first
         pairs.sort(key=lambda pair: score_column_match(pair[0], pair[1], words))
 
-    to_delete = []
-    for i, (_depth_column, material_description_rect) in enumerate(pairs):
-        if any(material_description_rect.intersects(other_rect) for _, other_rect in pairs[i + 1 :]):
-            to_delete.append(i)
+    to_delete = _intersected_by_later_rect([material_description_rect for _, material_description_rect in pairs])
     filtered_pairs = [item for index, item in enumerate(pairs) if index not in to_delete]
 
     groups = []  # list of matched depth intervals and text blocks
@@ -171,8 +168,38 @@ def process_page(
     return predictions, json_filtered_pairs
 
 
+def _intersected_by_later_rect(rects: list[fitz.Rect]) -> set[int]:
+    """Find the indices of all rectangles that intersect with any rectangle that comes later in the list.
+
+    Equivalent to checking rects[i].intersects(rects[j]) for all i < j, but implemented as a sweep over the
+    rectangles sorted by their y0 coordinate, such that only rectangles with overlapping y-ranges are compared.
+
+    Args:
+        rects (list[fitz.Rect]): The rectangles.
+
+    Returns:
+        set[int]: The indices of the rectangles that intersect with a later rectangle.
+    """
+    intersected = set()
+    active = []  # indices of the rectangles whose y-range can still overlap with the current rectangle
+    for index in sorted(range(len(rects)), key=lambda index: rects[index].y0):
+        rect = rects[index]
+        if rect.is_empty or rect.is_infinite:  # such rectangles never intersect anything
+            continue
+        active = [other_index for other_index in active if rects[other_index].y1 > rect.y0]
+        for other_index in active:
+            other_rect = rects[other_index]
+            if other_rect.x0 < rect.x1 and rect.x0 < other_rect.x1:
+                intersected.add(min(index, other_index))
+        active.append(index)
+    return intersected
+
+
 def score_column_match(
-    depth_column: DepthColumn, material_description_rect: fitz.Rect, all_words: list[TextWord] | None = None
+    depth_column: DepthColumn,
+    material_description_rect: fitz.Rect,
+    all_words: list[TextWord] | None = None,
+    depth_column_rect: fitz.Rect | None = None,
 ) -> float:
     """Scores the match between a depth column and a material description.
 
@@ -180,11 +207,13 @@ def score_column_match(
         depth_column (DepthColumn): The depth column.
         material_description_rect (fitz.Rect): The material description rectangle.
         all_words (list[TextLine] | None, optional): List of the available textlines. Defaults to None.
+        depth_column_rect (fitz.Rect | None, optional): The rectangle of the depth column, if already known to the
+                                                        caller. Defaults to None, in which case it is computed.
 
     Returns:
         float: The score of the match.
     """
-    rect = depth_column.rect()
+    rect = depth_column_rect if depth_column_rect is not None else depth_column.rect()
     top = rect.y0
     bottom = rect.y1
     right = rect.x1
@@ -302,19 +331,16 @@ def merge_blocks_by_vertical_spacing(blocks: list[TextBlock], target_merge_count
     Returns:
         List[TextBlock]: The merged textblocks.
     """
-    distances = []
-    for block_index in range(len(blocks) - 1):
-        distances.append(block_distance(blocks[block_index], blocks[block_index + 1]))
+    distances = [
+        block_distance(blocks[block_index], blocks[block_index + 1]) for block_index in range(len(blocks) - 1)
+    ]
     cutoff = sorted(distances)[target_merge_count - 1]  # merge all blocks that have a distance smaller than this
     merged_count = 0
     merged_blocks = []
     current_merged_block = blocks[0]
     for block_index in range(len(blocks) - 1):
         new_block = blocks[block_index + 1]
-        if (
-            merged_count < target_merge_count
-            and block_distance(blocks[block_index], blocks[block_index + 1]) <= cutoff
-        ):
+        if merged_count < target_merge_count and distances[block_index] <= cutoff:
             current_merged_block = current_merged_block.concatenate(new_block)
             merged_count += 1
         else:
@@ -345,16 +371,17 @@ def split_blocks_by_textline_length(blocks: list[TextBlock], target_split_count:
     if len(line_lengths) <= target_split_count:  # In that case each line is a block
         return [TextBlock([line]) for block in blocks for line in block.lines]
     else:
-        cutoff_values = line_lengths[:target_split_count]  # all lines inside cutoff_values will be split line
+        # all lines inside cutoff_values will be split line; counts keep track of duplicate values
+        cutoff_values = Counter(line_lengths[:target_split_count])
         split_blocks = []
         current_block_lines = []
         for block in blocks:
             for line_index in range(block.line_count):
                 line = block.lines[line_index]
                 current_block_lines.append(line)
-                if line_index < block.line_count - 1 and line.rect.x1 in cutoff_values:
+                if line_index < block.line_count - 1 and cutoff_values[line.rect.x1] > 0:
                     split_blocks.append(TextBlock(current_block_lines))
-                    cutoff_values.remove(line.rect.x1)
+                    cutoff_values[line.rect.x1] -= 1
                     current_block_lines = []
             if current_block_lines:
                 split_blocks.append(TextBlock(current_block_lines))
@@ -371,6 +398,9 @@ def find_material_description_column(
 ) -> fitz.Rect | None:
     """Find the material description column given a depth column.
 
+    All the geometric conditions are evaluated on arrays with the coordinates of the lines, instead of looping over
+    the individual lines.
+
     Args:
         lines (list[TextLine]): The text lines of the page.
         depth_column (DepthColumn | None): The depth column.
@@ -380,104 +410,111 @@ def find_material_description_column(
     Returns:
         fitz.Rect | None: The material description column.
     """
-    if depth_column:
-        above_depth_column = [
-            line
-            for line in lines
-            if x_overlap(line.rect, depth_column.rect()) and line.rect.y0 < depth_column.rect().y0
-        ]
-
-        min_y0 = max(line.rect.y0 for line in above_depth_column) if above_depth_column else -1
+    x0, y0, x1, y1 = rects_to_soa([line.rect for line in lines])
 
-        def check_y0_condition(y0):
-            return y0 > min_y0 and y0 < depth_column.rect().y1
+    if depth_column:
+        depth_column_rect = depth_column.rect()
+        is_above_depth_column = (np.minimum(x1, depth_column_rect.x1) - np.maximum(x0, depth_column_rect.x0) > 0) & (
+            y0 < depth_column_rect.y0
+        )
+        min_y0 = y0[is_above_depth_column].max() if is_above_depth_column.any() else -1
+        is_candidate = (y0 > min_y0) & (y0 < depth_column_rect.y1)
     else:
+        is_candidate = np.ones(len(lines), dtype=bool)
 
-        def check_y0_condition(y0):
-            return True
-
-    candidate_description = [line for line in lines if check_y0_condition(line.rect.y0)]
-    is_description = [line for line in candidate_description if line.is_description(params[language])]
-
-    if len(candidate_description) == 0:
+    candidate_indices = np.flatnonzero(is_candidate)
+    if len(candidate_indices) == 0:
         return
 
-    description_clusters = []
-    while len(is_description) > 0:
-        coverage_by_generating_line = [
-            [other for other in is_description if x_overlap_significant_smallest(line.rect, other.rect, 0.5)]
-            for line in is_description
-        ]
+    candidate_x0 = x0[candidate_indices]
+    candidate_y0 = y0[candidate_indices]
+    candidate_x1 = x1[candidate_indices]
+    candidate_y1 = y1[candidate_indices]
 
-        def filter_coverage(coverage):
-            if coverage:
-                min_x0 = min(line.rect.x0 for line in coverage)
-                max_x1 = max(line.rect.x1 for line in coverage)
-                x0_threshold = max_x1 - 0.4 * (
-                    max_x1 - min_x0
-                )  #  how did we determine the 0.4? Should it be a parameter? What would it do if we were to change it?
-                return [line for line in coverage if line.rect.x0 < x0_threshold]
-            else:
-                return []
+    description_indices = np.array(
+        [index for index in candidate_indices if lines[index].is_description(params[language])], dtype=np.intp
+    )
+    description_x0 = x0[description_indices]
+    description_x1 = x1[description_indices]
+    description_coordinates = np.column_stack((x0, y0, x1, y1))[description_indices]
+
+    # significant_overlap[i, j] tells whether description lines i and j overlap by more than 50% of the width of the
+    # narrowest one
+    significant_overlap = batch_x_overlap_significant(description_coordinates, description_coordinates, 0.5)
 
-        coverage_by_generating_line = [filter_coverage(coverage) for coverage in coverage_by_generating_line]
-        max_coverage = max(coverage_by_generating_line, key=len)
-        description_clusters.append(max_coverage)
-        is_description = [line for line in is_description if line not in max_coverage]
+    description_clusters = []
+    remaining = np.arange(len(description_indices))
+    while len(remaining) > 0:
+        coverage = significant_overlap[np.ix_(remaining, remaining)]
+        remaining_x0 = description_x0[remaining]
+        remaining_x1 = description_x1[remaining]
+
+        # filter the coverage of each generating line
+        with np.errstate(invalid="ignore"):  # rows without any coverage result in NaN thresholds
+            min_x0 = np.where(coverage, remaining_x0[None, :], np.inf).min(axis=1)
+            max_x1 = np.where(coverage, remaining_x1[None, :], -np.inf).max(axis=1)
+            x0_threshold = max_x1 - 0.4 * (
+                max_x1 - min_x0
+            )  #  how did we determine the 0.4? Should it be a parameter? What would it do if we were to change it?
+            coverage &= remaining_x0[None, :] < x0_threshold[:, None]
+
+        max_coverage = coverage[coverage.sum(axis=1).argmax()]
+        description_clusters.append(remaining[max_coverage])
+        remaining = remaining[~max_coverage]
 
     candidate_rects = []
 
     for cluster in description_clusters:
-        best_y0 = min([line.rect.y0 for line in cluster])
-        best_y1 = max([line.rect.y1 for line in cluster])
-
-        min_description_x0 = min(
-            [
-                line.rect.x0 - 0.01 * line.rect.width for line in cluster
-            ]  # How did we determine the 0.01? Should it be a parameter? What would it do if we were to change it?
+        cluster_indices = description_indices[cluster]
+        cluster_x0 = x0[cluster_indices]
+        cluster_widths = np.maximum(x1[cluster_indices] - cluster_x0, 0)
+        best_y0 = y0[cluster_indices].min()
+        best_y1 = y1[cluster_indices].max()
+
+        min_description_x0 = (
+            cluster_x0 - 0.01 * cluster_widths
+        ).min()  # How did we determine the 0.01? Should it be a parameter? What would it do if we were to change it?
+        max_description_x0 = (
+            cluster_x0 + 0.2 * cluster_widths
+        ).max()  # How did we determine the 0.2? Should it be a parameter? What would it do if we were to change it?
+        is_good_line = (
+            (candidate_y0 >= best_y0)
+            & (candidate_y1 <= best_y1)
+            & (min_description_x0 < candidate_x0)
+            & (candidate_x0 < max_description_x0)
         )
-        max_description_x0 = max(
-            [
-                line.rect.x0 + 0.2 * line.rect.width for line in cluster
-            ]  # How did we determine the 0.2? Should it be a parameter? What would it do if we were to change it?
-        )
-        good_lines = [
-            line
-            for line in candidate_description
-            if line.rect.y0 >= best_y0 and line.rect.y1 <= best_y1
-            if min_description_x0 < line.rect.x0 < max_description_x0
-        ]
-        best_x0 = min([line.rect.x0 for line in good_lines])
-        best_x1 = max([line.rect.x1 for line in good_lines])
+        best_x0 = candidate_x0[is_good_line].min()
+        best_x1 = candidate_x1[is_good_line].max()
 
         # expand to include entire last block
-        def is_below(best_x0, best_y1, line):
-            return (
+        continue_search = True
+        while continue_search:
+            is_below = (
                 (
-                    line.rect.x0 > best_x0 - 5
+                    x0 > best_x0 - 5
                 )  # How did we determine the 5? Should it be a parameter? What would it do if we were to change it?
-                and (line.rect.x0 < (best_x0 + best_x1) / 2)  # noqa B023
-                and (
-                    line.rect.y0 < best_y1 + 10
+                & (x0 < (best_x0 + best_x1) / 2)
+                & (
+                    y0 < best_y1 + 10
                 )  # How did we determine the 10? Should it be a parameter? What would it do if we were to change it?
-                and (line.rect.y1 > best_y1)
+                & (y1 > best_y1)
             )
-
-        continue_search = True
-        while continue_search:
-            line = next((line for line in lines if is_below(best_x0, best_y1, line)), None)
-            if line:
-                best_x0 = min(best_x0, line.rect.x0)
-                best_x1 = max(best_x1, line.rect.x1)
-                best_y1 = line.rect.y1
+            if is_below.any():
+                line_index = is_below.argmax()
+                best_x0 = min(best_x0, x0[line_index])
+                best_x1 = max(best_x1, x1[line_index])
+                best_y1 = y1[line_index]
             else:
                 continue_search = False
 
-        candidate_rects.append(fitz.Rect(best_x0, best_y0, best_x1, best_y1))
+        candidate_rects.append(fitz.Rect(float(best_x0), float(best_y0), float(best_x1), float(best_y1)))
 
     if len(candidate_rects) == 0:
         return None
     if depth_column:
-        return max(candidate_rects, key=lambda rect: score_column_match(depth_column, rect))
+        return max(
+            candidate_rects,
+            key=lambda rect: score_column_match(depth_column, rect, depth_column_rect=depth_column_rect),
+        )
     else:
         return candidate_rects[0]
@@ -56,10 +56,11 @@ class LayerIdentifierColumn:
         Returns:
             fitz.Rect: The rectangle of the layer identifier column.
         """
-        x0 = min([rect.x0 for rect in self.rects()])
-        x1 = max([rect.x1 for rect in self.rects()])
-        y0 = min([rect.y0 for rect in self.rects()])
-        y1 = max([rect.y1 for rect in self.rects()])
+        rects = self.rects()
+        x0 = min([rect.x0 for rect in rects])
+        x1 = max([rect.x1 for rect in rects])
+        y0 = min([rect.y0 for rect in rects])
+        y1 = max([rect.y1 for rect in rects])
         return fitz.Rect(x0, y0, x1, y1)
 
     def rects(self) -> list[fitz.Rect]:
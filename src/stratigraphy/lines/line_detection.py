@@ -13,7 +13,7 @@ from stratigraphy.lines.geometric_line_utilities import (
     merge_parallel_lines_quadtree,
 )
 from stratigraphy.util.dataclasses import Line
-from stratigraphy.util.util import line_from_array, read_params
+from stratigraphy.util.util import lines_from_array, read_params
 
 load_dotenv()
 
@@ -51,7 +51,7 @@ def detect_lines_lsd(page: fitz.Page, scale_factor=2, lsd_params=None) -> ArrayL
 
     # Detect lines in the image
     lines = lsd.detect(gray)[0]
-    return [line_from_array(line, scale_factor) for line in lines]
+    return lines_from_array(lines, scale_factor)
 
 
 def extract_lines(page: fitz.Page, line_detection_params: dict) -> list[Line]:
@@ -3,9 +3,12 @@
 import json
 import logging
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 import click
+import cv2
 import fitz
 from dotenv import load_dotenv
 from tqdm import tqdm
@@ -83,6 +86,14 @@ def common_options(f):
         default=False,
         help="Whether to draw lines on pdf pages. Defaults to False.",
     )(f)
+    f = click.option(
+        "-w",
+        "--max-workers",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Maximum number of processes used to process the pdf files in parallel. Defaults to the number of "
+        "processors of the machine.",
+    )(f)
     return f
 
 
@@ -99,6 +110,7 @@ def click_pipeline(
     metadata_path: Path,
     skip_draw_predictions: bool = False,
     draw_lines: bool = False,
+    max_workers: int | None = None,
     part: str = "all",
 ):
     """Run the boreholes data extraction pipeline."""
@@ -111,6 +123,7 @@ def click_pipeline(
         skip_draw_predictions=skip_draw_predictions,
         draw_lines=draw_lines,
         part=part,
+        max_workers=max_workers,
     )
 
 
@@ -124,6 +137,7 @@ def click_pipeline_metadata(
     metadata_path: Path,
     skip_draw_predictions: bool = False,
     draw_lines: bool = False,
+    max_workers: int | None = None,
 ):
     """Run only the metadata part of the pipeline."""
     start_pipeline(
@@ -135,6 +149,7 @@ def click_pipeline_metadata(
         skip_draw_predictions=skip_draw_predictions,
         draw_lines=draw_lines,
         part="metadata",
+        max_workers=max_workers,
     )
 
 
@@ -161,6 +176,93 @@ def setup_mlflow_tracking(
     mlflow.log_params(flatten(matching_params))
 
 
+def process_file(
+    in_path: Path, part: str, draw_lines: bool, temp_directory: Path
+) -> tuple[BoreholeMetadata, dict | None, list[Path]]:
+    """Extract the metadata and, if requested, the layers and groundwater information from a single pdf file.
+
+    This function is executed in a separate worker process for each file, so it does not log anything to MLFlow.
+    Instead, the images of the detected lines are written to temp_directory page by page, and their paths are
+    returned to the caller.
+
+    Args:
+        in_path (Path): The path to the pdf file.
+        part (str): The part of the pipeline to run.
+        draw_lines (bool): Whether to draw the detected lines on the pdf pages.
+        temp_directory (Path): The directory to write the images of the detected lines to.
+
+    Returns:
+        tuple[BoreholeMetadata, dict | None, list[Path]]: The metadata of the file, the predictions for the file
+                                                          (None if only the metadata part of the pipeline is run),
+                                                          and the paths of the images of the detected lines to log
+                                                          to MLFlow.
+    """
+    logger.info("Processing file: %s", in_path)
+    filename = in_path.name
+    file_predictions = None
+    line_image_paths = []
+
+    with fitz.Document(in_path) as doc:
+        # Extract metadata
+        metadata = BoreholeMetadata(doc)
+
+        if part == "all":
+            file_predictions = {}
+
+            # Extract the groundwater levels
+            groundwater_extractor = GroundwaterLevelExtractor(document=doc)
+            groundwater = groundwater_extractor.extract_groundwater(terrain_elevation=metadata.elevation)
+            if groundwater:
+                file_predictions["groundwater"] = [groundwater_entry.to_json() for groundwater_entry in groundwater]
+            else:
+                file_predictions["groundwater"] = None
+
+            layer_predictions_list = []
+            depths_materials_column_pairs_list = []
+            page_dimensions = []
+            for page_index, page in enumerate(doc):
+                page_number = page_index + 1
+                logger.info("Processing page %s", page_number)
+
+                text_lines = extract_text_lines(page)
+                geometric_lines = extract_lines(page, line_detection_params)
+                layer_predictions, depths_materials_column_pairs = process_page(
+                    text_lines, geometric_lines, metadata.language, page_number, **matching_params
+                )
+
+                # TODO: Add remove duplicates here!
+                if page_index > 0:
+                    layer_predictions = remove_duplicate_layers(
+                        doc[page_index - 1],
+                        page,
+                        layer_predictions_list,
+                        layer_predictions,
+                        matching_params["img_template_probability_threshold"],
+                    )
+
+                layer_predictions_list.extend(layer_predictions)
+                depths_materials_column_pairs_list.extend(depths_materials_column_pairs)
+                page_dimensions.append({"height": page.rect.height, "width": page.rect.width})
+
+                if draw_lines:  # could be changed to if draw_lines and mflow_tracking:
+                    if not mlflow_tracking:
+                        logger.warning("MLFlow tracking is not enabled. MLFLow is required to store the images.")
+                    else:
+                        img = plot_lines(page, geometric_lines, scale_factor=line_detection_params["pdf_scale_factor"])
+                        # write the image right away, so that only one page image is held in memory at a time
+                        line_image_path = temp_directory / f"{filename}_page_{page.number + 1}_lines.png"
+                        cv2.imwrite(str(line_image_path), img)
+                        line_image_paths.append(line_image_path)
+
+            file_predictions["layers"] = layer_predictions_list
+            file_predictions["depths_materials_column_pairs"] = depths_materials_column_pairs_list
+            file_predictions["page_dimensions"] = (
+                metadata.page_dimensions
+            )  # TODO: Remove this as it is already stored in the metadata
+
+    return metadata, file_predictions, line_image_paths
+
+
 def start_pipeline(
     input_directory: Path,
     ground_truth_path: Path,
@@ -170,6 +272,7 @@ def start_pipeline(
     skip_draw_predictions: bool = False,
     draw_lines: bool = False,
     part: str = "all",
+    max_workers: int | None = None,
 ):
     """Run the boreholes data extraction pipeline.
 
@@ -189,6 +292,8 @@ def start_pipeline(
         draw_lines (bool, optional): Whether to draw lines on pdf pages. Defaults to False.
         metadata_path (Path): The path to the metadata file.
         part (str, optional): The part of the pipeline to run. Defaults to "all".
+        max_workers (int | None, optional): The maximum number of processes used to process the pdf files in
+                                            parallel. Defaults to None, i.e. the number of processors of the machine.
     """  # noqa: D301
     if mlflow_tracking:
         setup_mlflow_tracking(input_directory, ground_truth_path, out_directory, predictions_path, metadata_path)
@@ -205,11 +310,10 @@ def start_pipeline(
 
     # if a file is specified instead of an input directory, copy the file to a temporary directory and work with that.
     if input_directory.is_file():
-        root = input_directory.parent
-        files = [input_directory.name]
+        in_paths = [input_directory]
     else:
-        root = input_directory
-        _, _, files = next(os.walk(input_directory))
+        with os.scandir(input_directory) as entries:
+            in_paths = [Path(entry.path) for entry in entries if entry.is_file()]
 
     # process the individual pdf files
     predictions = {}
@@ -217,84 +321,36 @@ def start_pipeline(
     # process the individual pdf files
     metadata_per_file = BoreholeMetadataList()
 
-    for filename in tqdm(files, desc="Processing files", unit="file"):
-        if filename.endswith(".pdf"):
-            in_path = os.path.join(root, filename)
-            logger.info("Processing file: %s", in_path)
-
-            with fitz.Document(in_path) as doc:
-                # Extract metadata
-                metadata = BoreholeMetadata(doc)
+    in_paths = [in_path for in_path in in_paths if in_path.name.endswith(".pdf")]
 
-                # Add metadata to the metadata list
-                metadata_per_file.metadata_per_file.append(metadata)
+    # The files are independent of each other, so they are processed in parallel. Logging to MLFlow only happens in
+    # this (parent) process. executor.map() returns the results in the same order as the files.
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(process_file, in_paths, repeat(part), repeat(draw_lines), repeat(temp_directory))
+        for in_path, (metadata, file_predictions, line_image_paths) in tqdm(
+            zip(in_paths, results, strict=True),
+            total=len(in_paths),
+            desc="Processing files",
+            unit="file",
+        ):
+            # Add metadata to the metadata list
+            metadata_per_file.metadata_per_file.append(metadata)
 
-                if part == "all":
-                    predictions[filename] = {}
+            if part == "all":
+                predictions[in_path.name] = file_predictions
 
-                    # Extract the groundwater levels
-                    groundwater_extractor = GroundwaterLevelExtractor(document=doc)
-                    groundwater = groundwater_extractor.extract_groundwater(terrain_elevation=metadata.elevation)
-                    if groundwater:
-                        predictions[filename]["groundwater"] = [
-                            groundwater_entry.to_json() for groundwater_entry in groundwater
-                        ]
-                    else:
-                        predictions[filename]["groundwater"] = None
-
-                    layer_predictions_list = []
-                    depths_materials_column_pairs_list = []
-                    page_dimensions = []
-                    for page_index, page in enumerate(doc):
-                        page_number = page_index + 1
-                        logger.info("Processing page %s", page_number)
-
-                        text_lines = extract_text_lines(page)
-                        geometric_lines = extract_lines(page, line_detection_params)
-                        layer_predictions, depths_materials_column_pairs = process_page(
-                            text_lines, geometric_lines, metadata.language, page_number, **matching_params
-                        )
-
-                        # TODO: Add remove duplicates here!
-                        if page_index > 0:
-                            layer_predictions = remove_duplicate_layers(
-                                doc[page_index - 1],
-                                page,
-                                layer_predictions_list,
-                                layer_predictions,
-                                matching_params["img_template_probability_threshold"],
-                            )
-
-                        layer_predictions_list.extend(layer_predictions)
-                        depths_materials_column_pairs_list.extend(depths_materials_column_pairs)
-                        page_dimensions.append({"height": page.rect.height, "width": page.rect.width})
-
-                        if draw_lines:  # could be changed to if draw_lines and mflow_tracking:
-                            if not mlflow_tracking:
-                                logger.warning(
-                                    "MLFlow tracking is not enabled. MLFLow is required to store the images."
-                                )
-                            else:
-                                img = plot_lines(
-                                    page, geometric_lines, scale_factor=line_detection_params["pdf_scale_factor"]
-                                )
-                                mlflow.log_image(img, f"pages/{filename}_page_{page.number + 1}_lines.png")
-
-                if part == "all":
-                    predictions[filename]["layers"] = layer_predictions_list
-                    predictions[filename]["depths_materials_column_pairs"] = depths_materials_column_pairs_list
-                    predictions[filename]["page_dimensions"] = (
-                        metadata.page_dimensions
-                    )  # TODO: Remove this as it is already stored in the metadata
+            for line_image_path in line_image_paths:
+                mlflow.log_artifact(line_image_path, artifact_path="pages")
 
     logger.info("Metadata written to %s", metadata_path)
     with open(metadata_path, "w", encoding="utf8") as file:
-        json.dump(metadata_per_file.to_json(), file, ensure_ascii=False)
+        # json.dumps() uses the C encoder, whereas json.dump() falls back to the much slower pure Python encoder.
+        file.write(json.dumps(metadata_per_file.to_json(), ensure_ascii=False))
 
     if part == "all":
         logger.info("Writing predictions to JSON file %s", predictions_path)
         with open(predictions_path, "w", encoding="utf8") as file:
-            json.dump(predictions, file, ensure_ascii=False)
+            file.write(json.dumps(predictions, ensure_ascii=False))
 
     evaluate(
         predictions=predictions,
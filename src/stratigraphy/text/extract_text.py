@@ -1,5 +1,7 @@
 """Methods for extracting plain text from a PDF document."""
 
+from collections import defaultdict
+
 import fitz
 from stratigraphy.lines.line import TextLine, TextWord
 
@@ -31,18 +33,14 @@ def extract_text_lines_from_bbox(page: fitz.Page, bbox: fitz.Rect | None) -> lis
     Returns:
         list[TextLine]: A list of text lines.
     """
-    words = []
-    words_by_line = {}
+    rotation_matrix = page.rotation_matrix  # computed by PyMuPDF on every access, so only look it up once
+    page_number = page.number + 1
+    words_by_line = defaultdict(list)
     for x0, y0, x1, y1, word, block_no, line_no, _word_no in page.get_text("words", clip=bbox):
-        rect = fitz.Rect(x0, y0, x1, y1) * page.rotation_matrix
-        text_word = TextWord(rect, word, page.number + 1)
-        words.append(text_word)
-        key = f"{block_no}_{line_no}"
-        if key not in words_by_line:
-            words_by_line[key] = []
-        words_by_line[key].append(text_word)
-
-    raw_lines = [TextLine(words_by_line[key]) for key in words_by_line]
+        rect = fitz.Rect(x0, y0, x1, y1) * rotation_matrix
+        words_by_line[(block_no, line_no)].append(TextWord(rect, word, page_number))
+
+    raw_lines = [TextLine(words) for words in words_by_line.values()]
 
     lines = []
     current_line_words = []
@@ -1,15 +1,27 @@
 """This module contains general utility functions for the stratigraphy module."""
 
+import os
 import re
-from collections.abc import MutableMapping
+from collections import OrderedDict
+from collections.abc import MutableMapping, Sequence
+from pathlib import Path
+from typing import Literal
 
 import fitz
+import numpy as np
 import yaml
 from numpy.typing import ArrayLike
 
 from stratigraphy import PROJECT_ROOT
 from stratigraphy.util.dataclasses import Line, Point
 
+# use the libyaml based C implementation of the loader when PyYAML was built with it
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# parsed yaml files by path, together with the modification time and size of the file when it was parsed
+_PARAMS_CACHE: OrderedDict[str, tuple[int, int, dict]] = OrderedDict()
+_PARAMS_CACHE_MAX_SIZE = 100
+
 
 def x_overlap(rect1: fitz.Rect, rect2: fitz.Rect) -> float:  # noqa: D103
     """Calculate the x overlap between two rectangles.
@@ -33,12 +45,15 @@ def x_overlap_significant_smallest(rect1: fitz.Rect, rect2: fitz.Rect, level: fl
     Args:
         rect1 (fitz.Rect): First rectangle.
         rect2 (fitz.Rect): Second rectangle.
-        level (float): Level of significance.
+        level (float): Level of significance (non-negative).
 
     Returns:
         bool: True if the x overlap is significant, otherwise False.
     """
-    return x_overlap(rect1, rect2) > level * min(rect1.width, rect2.width)
+    x0_1, x1_1, x0_2, x1_2 = rect1.x0, rect1.x1, rect2.x0, rect2.x1
+    if x1_1 <= x0_2 or x1_2 <= x0_1:
+        return False  # quick rejection of rectangles whose x ranges do not overlap
+    return min(x1_1, x1_2) - max(x0_1, x0_2) > level * min(rect1.width, rect2.width)
 
 
 def x_overlap_significant_largest(rect1: fitz.Rect, rect2: fitz.Rect, level: float) -> bool:  # noqa: D103
@@ -47,12 +62,79 @@ def x_overlap_significant_largest(rect1: fitz.Rect, rect2: fitz.Rect, level: flo
     Args:
         rect1 (fitz.Rect): First rectangle.
         rect2 (fitz.Rect): Second rectangle.
-        level (float): Level of significance.
+        level (float): Level of significance (non-negative).
 
     Returns:
         bool: True if the x overlap is significant, otherwise False.
     """
-    return x_overlap(rect1, rect2) > level * max(rect1.width, rect2.width)
+    x0_1, x1_1, x0_2, x1_2 = rect1.x0, rect1.x1, rect2.x0, rect2.x1
+    if x1_1 <= x0_2 or x1_2 <= x0_1:
+        return False  # quick rejection of rectangles whose x ranges do not overlap
+    return min(x1_1, x1_2) - max(x0_1, x0_2) > level * max(rect1.width, rect2.width)
+
+
+def _rect_coordinate_array(rects: Sequence[fitz.Rect] | np.ndarray) -> np.ndarray:
+    """Return the coordinates of the rectangles as an array of shape (N, 4) with the columns (x0, y0, x1, y1)."""
+    if isinstance(rects, np.ndarray):
+        return rects.astype(np.float64, copy=False).reshape(-1, 4)
+    return np.array([(rect.x0, rect.y0, rect.x1, rect.y1) for rect in rects], dtype=np.float64).reshape(-1, 4)
+
+
+def rects_to_soa(rects: Sequence[fitz.Rect]) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Convert rectangles to a "structure of arrays", i.e. separate arrays with the x0, y0, x1 and y1 coordinates.
+
+    The coordinates of every rectangle are read only once, so that hot loops can work on the arrays instead of
+    accessing the attributes of the fitz.Rect objects over and over again.
+
+    Args:
+        rects (Sequence[fitz.Rect]): The rectangles.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: The x0, y0, x1 and y1 coordinates of the rectangles.
+    """
+    x0, y0, x1, y1 = np.ascontiguousarray(_rect_coordinate_array(rects).T)
+    return x0, y0, x1, y1
+
+
+def batch_x_overlap_significant(
+    rects_a: Sequence[fitz.Rect] | np.ndarray,
+    rects_b: Sequence[fitz.Rect] | np.ndarray,
+    level: float,
+    mode: Literal["smallest", "largest"] = "smallest",
+) -> np.ndarray:
+    """Check for all pairs of rectangles whether their x overlap is significant.
+
+    Gives the same result as x_overlap_significant_smallest (mode "smallest") or x_overlap_significant_largest
+    (mode "largest") for every pair, but evaluates all pairs at once.
+
+    Args:
+        rects_a (Sequence[fitz.Rect] | np.ndarray): First rectangles, or an array of shape (N, 4) with their
+                                                   coordinates (x0, y0, x1, y1).
+        rects_b (Sequence[fitz.Rect] | np.ndarray): Second rectangles, or an array of shape (M, 4) with their
+                                                   coordinates (x0, y0, x1, y1).
+        level (float): Level of significance.
+        mode (Literal["smallest", "largest"], optional): Whether the overlap is compared to the width of the narrowest
+                                                          or of the widest rectangle. Defaults to "smallest".
+
+    Returns:
+        np.ndarray: Boolean array of shape (N, M), where entry (i, j) tells whether the x overlap between rects_a[i]
+                    and rects_b[j] is significant.
+    """
+    coordinates_a = _rect_coordinate_array(rects_a)
+    coordinates_b = _rect_coordinate_array(rects_b)
+    x0_a, x1_a = coordinates_a[:, 0, None], coordinates_a[:, 2, None]
+    x0_b, x1_b = coordinates_b[None, :, 0], coordinates_b[None, :, 2]
+
+    overlap = np.maximum(np.minimum(x1_a, x1_b) - np.maximum(x0_a, x0_b), 0.0)
+    widths_a = np.maximum(x1_a - x0_a, 0.0)
+    widths_b = np.maximum(x1_b - x0_b, 0.0)
+    if mode == "smallest":
+        width = np.minimum(widths_a, widths_b)
+    elif mode == "largest":
+        width = np.maximum(widths_a, widths_b)
+    else:
+        raise ValueError(f"Unknown mode {mode}, expected 'smallest' or 'largest'.")
+    return overlap > level * width
 
 
 def flatten(dictionary: dict, parent_key: str = "", separator: str = "__") -> dict:
@@ -66,14 +148,22 @@ def flatten(dictionary: dict, parent_key: str = "", separator: str = "__") -> di
     Returns:
         Dict: Flattened dictionary.
     """
-    items = []
-    for key, value in dictionary.items():
-        new_key = parent_key + separator + key if parent_key else key
-        if isinstance(value, MutableMapping):
-            items.extend(flatten(value, new_key, separator=separator).items())
+    flattened = {}
+    # Depth-first traversal with an explicit stack of (key prefix, iterator over the items) pairs. Nested dictionaries
+    # are visited as soon as they are encountered, so the keys are in the same order as with a recursive traversal.
+    stack = [(parent_key, iter(dictionary.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            new_key = prefix + separator + key if prefix else key
+            # the type check is much cheaper than the isinstance check against the ABC for the common case of a dict
+            if type(value) is dict or isinstance(value, MutableMapping):  # noqa: E721
+                stack.append((new_key, iter(value.items())))
+                break
+            flattened[new_key] = value
         else:
-            items.append((new_key, value))
-    return dict(items)
+            stack.pop()
+    return flattened
 
 
 def line_from_array(line: ArrayLike, scale_factor: float) -> Line:
@@ -87,21 +177,69 @@ def line_from_array(line: ArrayLike, scale_factor: float) -> Line:
     Returns:
         Line: The converted line.
     """
-    start = Point(int(line[0][0] / scale_factor), int(line[0][1] / scale_factor))
-    end = Point(int(line[0][2] / scale_factor), int(line[0][3] / scale_factor))
+    x1, y1, x2, y2 = line[0]
+    start = Point(int(x1 / scale_factor), int(y1 / scale_factor))
+    end = Point(int(x2 / scale_factor), int(y2 / scale_factor))
     return Line(start, end)
 
 
+def lines_from_array(lines: ArrayLike, scale_factor: float) -> list[Line]:
+    """Convert an array of lines in the format of [[[x1, y1, x2, y2]], ...] to a list of Line objects.
+
+    Gives the same result as calling line_from_array on every line, but scales all the coordinates at once.
+
+    Args:
+        lines (ArrayLike): lines as represented by an array of shape (N, 1, 4).
+        scale_factor (float): The scale factor to apply to the lines. Required when
+                              the pdf page was scaled before detecting lines.
+
+    Returns:
+        list[Line]: The converted lines.
+    """
+    # Divide in float64 (and not e.g. multiply with the inverse scale factor), as line_from_array does for the scalar
+    # values, so that the truncated coordinates are exactly the same.
+    coordinates = (np.asarray(lines, dtype=np.float64).reshape(-1, 4) / scale_factor).astype(np.int64)
+    return [Line(Point(x1, y1), Point(x2, y2)) for x1, y1, x2, y2 in coordinates.tolist()]
+
+
+def _load_cached(path: Path) -> dict:
+    """Load a yaml file, reusing the parsed content while the modification time and size of the file stay the same.
+
+    The least recently used entry is evicted when the cache holds more than _PARAMS_CACHE_MAX_SIZE files.
+
+    Args:
+        path (Path): Path to the yaml file.
+
+    Returns:
+        dict: The parsed content of the file.
+    """
+    key = str(path)
+    stat = os.stat(path)
+    cached = _PARAMS_CACHE.get(key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        _PARAMS_CACHE.move_to_end(key)
+        return cached[2]
+
+    with open(path) as f:
+        params = yaml.load(f, Loader=_LOADER)
+
+    _PARAMS_CACHE[key] = (stat.st_mtime_ns, stat.st_size, params)
+    _PARAMS_CACHE.move_to_end(key)
+    if len(_PARAMS_CACHE) > _PARAMS_CACHE_MAX_SIZE:
+        _PARAMS_CACHE.popitem(last=False)
+    return params
+
+
 def read_params(params_name: str) -> dict:
     """Read parameters from a yaml file.
 
+    The parsed parameters are cached, and the same object is returned on repeated calls as long as the file does not
+    change. Callers must therefore not modify the returned dictionary.
+
     Args:
         params_name (str): Name of the params yaml file.
     """
-    with open(PROJECT_ROOT / "config" / params_name) as f:
-        params = yaml.safe_load(f)
-
-    return params
+    return _load_cached(PROJECT_ROOT / "config" / params_name)
 
 
 def parse_text(text: str) -> str:
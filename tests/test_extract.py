@@ -0,0 +1,106 @@
+"""Test suite for the extract module."""
+
+import fitz
+from stratigraphy.depthcolumn.depthcolumn import BoundaryDepthColumn
+from stratigraphy.depthcolumn.depthcolumnentry import DepthColumnEntry
+from stratigraphy.extract import find_material_description_column, split_blocks_by_textline_length
+from stratigraphy.lines.line import TextLine, TextWord
+from stratigraphy.text.textblock import TextBlock
+from stratigraphy.util.util import read_params
+
+material_description_params = read_params("matching_params.yml")["material_description"]
+page_number = 1
+
+
+def _line(rect: list[float], text: str) -> TextLine:
+    return TextLine([TextWord(fitz.Rect(rect), text, page_number)])
+
+
+lines = [
+    _line([0, 0, 40, 10], "Tiefe"),
+    _line([60, 0, 200, 10], "Beschreibung"),
+    _line([0, 20, 20, 30], "0.5"),
+    _line([60, 20, 180, 30], "Sand, braun"),
+    _line([60, 32, 150, 42], "mit Kies"),
+    _line([0, 50, 20, 60], "1.0"),
+    _line([60, 50, 190, 60], "Silt, grau"),
+    _line([60, 62, 120, 72], "weich"),
+    _line([300, 20, 400, 30], "Projekt"),
+]
+
+
+def test_find_material_description_column_without_depth_column():  # noqa: D103
+    """Test that the material description lines are found when no depth column is given."""
+    rect = find_material_description_column(lines, None, "de", **material_description_params)
+    assert rect == fitz.Rect(60, 20, 190, 72)
+
+
+def test_find_material_description_column_with_depth_column():  # noqa: D103
+    """Test that only lines next to the depth column are considered for the material description."""
+    depth_column = BoundaryDepthColumn(
+        [
+            DepthColumnEntry(fitz.Rect(0, 20, 20, 30), 0.5, page_number),
+            DepthColumnEntry(fitz.Rect(0, 50, 20, 60), 1.0, page_number),
+        ]
+    )
+    rect = find_material_description_column(lines, depth_column, "de", **material_description_params)
+    assert rect == fitz.Rect(60, 20, 190, 72)
+
+
+boundary_depth_column = BoundaryDepthColumn(
+    [
+        DepthColumnEntry(fitz.Rect(0, 20, 20, 30), 0.5, page_number),
+        DepthColumnEntry(fitz.Rect(0, 50, 20, 60), 1.0, page_number),
+    ]
+)
+column_lines = [
+    _line([0, 20, 20, 30], "0.5"),
+    _line([60, 20, 180, 30], "Sand, braun"),
+    _line([60, 32, 150, 42], "mit Kies"),
+    _line([0, 50, 20, 60], "1.0"),
+    _line([60, 50, 190, 60], "Silt, grau"),
+]
+
+
+def test_find_material_description_column_excludes_lines_above_depth_column():  # noqa: D103
+    """Test that description lines above the depth column that overlap with it in x are not considered."""
+    above_line = _line([0, 8, 180, 18], "Kies, sandig")
+    all_lines = [above_line, *column_lines]
+
+    rect = find_material_description_column(all_lines, None, "de", **material_description_params)
+    assert rect == fitz.Rect(0, 8, 190, 60)
+    rect = find_material_description_column(all_lines, boundary_depth_column, "de", **material_description_params)
+    assert rect == fitz.Rect(60, 20, 190, 60)
+
+
+def test_find_material_description_column_excludes_lines_below_depth_column():  # noqa: D103
+    """Test that description lines below the bottom of the depth column are not considered."""
+    below_lines = [_line([60, 120, 190, 130], "Ton, grau"), _line([60, 132, 150, 142], "mit Sand")]
+    all_lines = [*column_lines, *below_lines]
+
+    rect = find_material_description_column(all_lines, None, "de", **material_description_params)
+    assert rect == fitz.Rect(60, 20, 190, 142)
+    rect = find_material_description_column(all_lines, boundary_depth_column, "de", **material_description_params)
+    assert rect == fitz.Rect(60, 20, 190, 60)
+
+
+def test_find_material_description_column_no_candidates():  # noqa: D103
+    """Test that None is returned when there are no candidate lines."""
+    assert find_material_description_column([], None, "de", **material_description_params) is None
+
+
+def test_split_blocks_by_textline_length():  # noqa: D103
+    """Test that blocks are split after the shortest lines, also when several lines have the same length."""
+    block = TextBlock(
+        [
+            _line([0, 0, 100, 10], "Sand"),
+            _line([0, 10, 50, 20], "braun"),
+            _line([0, 20, 100, 30], "Kies"),
+            _line([0, 30, 50, 40], "grau"),
+            _line([0, 40, 100, 50], "Silt"),
+            _line([0, 50, 50, 60], "weich"),
+            _line([0, 60, 100, 70], "Mergel"),
+        ]
+    )
+    split_blocks = split_blocks_by_textline_length([block], target_split_count=2)
+    assert [split_block.text for split_block in split_blocks] == ["Sand braun", "Kies grau", "Silt weich Mergel"]
@@ -5,6 +5,7 @@ import pytest
 from stratigraphy.depthcolumn.depthcolumnentry import DepthColumnEntry
 from stratigraphy.depthcolumn.find_depth_columns import (
     depth_column_entries,
+    depth_column_entries_with_split_flag,
     find_depth_columns,
     find_layer_depth_columns,
 )
@@ -61,6 +62,28 @@ def test_depth_column_entries_with_splits():  # noqa: D103
     assert entries[3].value == 40.0, "The fourth entry should have a value of 40.0"
 
 
+def test_depth_column_entries_with_split_flag():  # noqa: D103
+    """Test that filtering out the split entries gives the same result as include_splits=False."""
+    all_words = [
+        TextWord(fitz.Rect(0, 0, 10, 1), "10.00-20.0m", PAGE_NUMBER),
+        TextWord(fitz.Rect(0, 2, 5, 3), "30.0m", PAGE_NUMBER),
+        TextWord(fitz.Rect(0, 4, 10, 5), "30.0-40.0m", PAGE_NUMBER),
+        TextWord(fitz.Rect(0, 6, 5, 7), "50.0m", PAGE_NUMBER),
+    ]
+    entries_with_split_flag = depth_column_entries_with_split_flag(all_words)
+    assert [(entry.value, is_split) for entry, is_split in entries_with_split_flag] == [
+        (10.0, True),
+        (20.0, True),
+        (30.0, False),
+        (30.0, True),
+        (40.0, True),
+        (50.0, False),
+    ]
+    assert [entry.value for entry, is_split in entries_with_split_flag if not is_split] == [
+        entry.value for entry in depth_column_entries(all_words, include_splits=False)
+    ]
+
+
 def test_depth_column_entries_with_leading_character():  # noqa: D103
     """Test the depth_column_entries function with a leading character."""
     all_words = [
@@ -0,0 +1,80 @@
+"""Test suite for the metrics module."""
+
+import pandas as pd
+import pytest
+from stratigraphy.benchmark.metrics import DatasetMetrics, DatasetMetricsCatalog
+from stratigraphy.evaluation.evaluation_dataclasses import Metrics
+
+
+def test_macro_averages():  # noqa: D103
+    """Test the macro averages of the DatasetMetrics class."""
+    dataset_metrics = DatasetMetrics()
+    dataset_metrics.metrics["a.pdf"] = Metrics(tp=1, fp=1, fn=0)  # precision 0.5, recall 1
+    dataset_metrics.metrics["b.pdf"] = Metrics(tp=0, fp=1, fn=1)  # precision 0, recall 0
+
+    assert dataset_metrics.macro_precision() == pytest.approx(0.25)
+    assert dataset_metrics.macro_recall() == pytest.approx(0.5)
+    assert dataset_metrics.macro_f1() == pytest.approx(1 / 3)
+    assert dataset_metrics.pseudo_macro_f1() == pytest.approx(2 * 0.25 * 0.5 / 0.75)
+
+    dataset_metrics.metrics["b.pdf"] = Metrics(tp=1, fp=0, fn=0)
+    assert dataset_metrics.macro_precision() == pytest.approx(0.75), "Mutating the metrics should update the result."
+
+
+def test_macro_averages_with_reference_to_metrics():  # noqa: D103
+    """Test that the macro averages are up to date when the metrics are modified through a kept reference."""
+    dataset_metrics = DatasetMetrics()
+    metrics = dataset_metrics.metrics
+    metrics["a.pdf"] = Metrics(tp=1, fp=0, fn=0)
+    assert dataset_metrics.macro_precision() == pytest.approx(1.0)
+    metrics["b.pdf"] = Metrics(tp=0, fp=1, fn=0)
+    assert dataset_metrics.macro_precision() == pytest.approx(0.5)
+
+
+def test_macro_averages_empty():  # noqa: D103
+    """Test the macro averages of a DatasetMetrics object without any documents."""
+    dataset_metrics = DatasetMetrics()
+    assert dataset_metrics.macro_f1() == 0
+    assert dataset_metrics.macro_precision() == 0
+    assert dataset_metrics.macro_recall() == 0
+    assert dataset_metrics.pseudo_macro_f1() == 0
+
+
+def test_micro_average():  # noqa: D103
+    """Test that Metrics.micro_average sums the counts of all metrics."""
+    assert Metrics.micro_average([]) == Metrics(tp=0, fp=0, fn=0)
+
+    dataset_metrics = DatasetMetrics()
+    dataset_metrics.metrics["a.pdf"] = Metrics(tp=1, fp=1, fn=0)
+    dataset_metrics.metrics["b.pdf"] = Metrics(tp=2, fp=0, fn=3)
+    micro_average = Metrics.micro_average(dataset_metrics.metrics.values())
+    assert micro_average == Metrics(tp=3, fp=1, fn=3)
+    assert isinstance(micro_average.tp, int)
+    assert micro_average.f1 == pytest.approx(2 * 0.75 * 0.5 / 1.25)
+
+
+def test_document_level_metrics_df():  # noqa: D103
+    """Test that the document level metrics of all DatasetMetrics objects are outer-joined on the document name."""
+    catalog = DatasetMetricsCatalog()
+    for key in ["layer", "depth_interval", "groundwater", "groundwater_depth"]:
+        catalog.metrics[key] = DatasetMetrics()
+    catalog.metrics["layer"].metrics["b.pdf"] = Metrics(tp=2, fp=0, fn=1)
+    catalog.metrics["layer"].metrics["a.pdf"] = Metrics(tp=1, fp=1, fn=0)
+    catalog.metrics["groundwater"].metrics["c.pdf"] = Metrics(tp=1, fp=0, fn=0)
+
+    df = catalog.document_level_metrics_df()
+    assert list(df.index) == ["a.pdf", "b.pdf", "c.pdf"]
+    assert list(df.columns) == [
+        "F1",
+        "precision",
+        "recall",
+        "Depth_interval_accuracy",
+        "Number Elements",
+        "Number wrong elements",
+        "groundwater",
+        "groundwater_depth",
+    ]
+    assert df.loc["b.pdf", "Number Elements"] == 3
+    assert df.loc["c.pdf", "groundwater"] == 1
+    assert pd.isna(df.loc["a.pdf", "groundwater"])
+    assert pd.isna(df.loc["c.pdf", "F1"])
@@ -0,0 +1,94 @@
+"""Test suite for the util module."""
+
+import os
+
+import fitz
+import numpy as np
+import pytest
+from stratigraphy.util import util
+from stratigraphy.util.util import (
+    batch_x_overlap_significant,
+    flatten,
+    line_from_array,
+    lines_from_array,
+    read_params,
+    rects_to_soa,
+    x_overlap,
+    x_overlap_significant_largest,
+    x_overlap_significant_smallest,
+)
+
+
+def test_read_params_cache(tmp_path, monkeypatch):  # noqa: D103
+    """Test that read_params reuses the parsed file, unless the file has been modified."""
+    monkeypatch.setattr(util, "PROJECT_ROOT", tmp_path)
+    (tmp_path / "config").mkdir()
+    params_path = tmp_path / "config" / "params.yml"
+    params_path.write_text("a: 1\n")
+
+    params = read_params("params.yml")
+    assert params == {"a": 1}
+    assert read_params("params.yml") is params
+
+    params_path.write_text("a: 22\n")
+    os.utime(params_path, ns=(0, 0))  # make sure the modification time changes on file systems with coarse mtimes
+    assert read_params("params.yml") == {"a": 22}
+
+
+def test_lines_from_array():  # noqa: D103
+    """Test that lines_from_array gives the same lines as line_from_array applied to every line."""
+    lines = np.array([[[10.5, 20.0, 31.9, 40.1]], [[0.0, 3.0, 5.0, 7.0]]], dtype=np.float32)
+    assert lines_from_array(lines, 3) == [line_from_array(line, 3) for line in lines]
+    assert lines_from_array(np.empty((0, 1, 4), dtype=np.float32), 2) == []
+
+
+@pytest.mark.parametrize(
+    "rect1,rect2,expected",
+    [
+        (fitz.Rect(0, 0, 10, 10), fitz.Rect(5, 20, 30, 30), 5),
+        (fitz.Rect(0, 0, 10, 10), fitz.Rect(2, 0, 4, 10), 2),
+        (fitz.Rect(0, 0, 10, 10), fitz.Rect(10, 0, 20, 10), 0),
+        (fitz.Rect(0, 0, 10, 10), fitz.Rect(20, 0, 30, 10), 0),
+    ],
+)
+def test_x_overlap(rect1, rect2, expected):  # noqa: D103
+    """Test the x overlap of two rectangles, which is symmetric and 0 for disjoint rectangles."""
+    assert x_overlap(rect1, rect2) == expected
+    assert x_overlap(rect2, rect1) == expected
+
+
+def test_batch_x_overlap_significant():  # noqa: D103
+    """Test that batch_x_overlap_significant agrees with x_overlap_significant_smallest/largest for all pairs."""
+    rects_a = [fitz.Rect(0, 0, 10, 10), fitz.Rect(5, 0, 6, 10), fitz.Rect(8, 0, 30, 10)]
+    rects_b = [fitz.Rect(0, 20, 4, 30), fitz.Rect(9, 20, 12, 30), fitz.Rect(40, 20, 50, 30), fitz.Rect(0, 0, 30, 5)]
+
+    smallest = batch_x_overlap_significant(rects_a, rects_b, 0.5)
+    largest = batch_x_overlap_significant(rects_a, rects_b, 0.5, mode="largest")
+    assert smallest.shape == largest.shape == (3, 4)
+    for i, rect_a in enumerate(rects_a):
+        for j, rect_b in enumerate(rects_b):
+            assert smallest[i, j] == x_overlap_significant_smallest(rect_a, rect_b, 0.5)
+            assert largest[i, j] == x_overlap_significant_largest(rect_a, rect_b, 0.5)
+
+    coordinates_a = np.array([tuple(rect) for rect in rects_a])
+    assert (batch_x_overlap_significant(coordinates_a, rects_b, 0.5) == smallest).all()
+    with pytest.raises(ValueError):
+        batch_x_overlap_significant(rects_a, rects_b, 0.5, mode="unknown")
+
+
+def test_flatten():  # noqa: D103
+    """Test that nested dictionaries are flattened depth-first, keeping the order of the keys."""
+    dictionary = {"a": {"b": 1, "c": {"d": 2}}, "e": 3, "f": {}, "g": {"h": 4}}
+    flattened = flatten(dictionary)
+    assert list(flattened.items()) == [("a__b", 1), ("a__c__d", 2), ("e", 3), ("g__h", 4)]
+    assert flatten({"a": {"b": 1}}, parent_key="p", separator=".") == {"p.a.b": 1}
+
+
+def test_rects_to_soa():  # noqa: D103
+    """Test that the coordinates of the rectangles are split into one array per coordinate."""
+    x0, y0, x1, y1 = rects_to_soa([fitz.Rect(0, 1, 2, 3), fitz.Rect(4.5, 5, 6, 7)])
+    assert x0.tolist() == [0, 4.5]
+    assert y0.tolist() == [1, 5]
+    assert x1.tolist() == [2, 6]
+    assert y1.tolist() == [3, 7]
+    assert all(len(array) == 0 for array in rects_to_soa([]))